@@ -0,0 +1,101 @@
+"""
+Compiled per-sample kernels shared by the F1 telemetry modules.
+
+Numba is optional: without it the kernels run as plain Python loops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional - run the kernels as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def interp_delta(common, d1, s1, d2, s2, out):
+    """
+    Interpolate both speed traces onto the common distances and write s1 - s2 to out.
+    
+    Serial on purpose: on the few-hundred-point delta grid, starting a thread pool
+    costs more than the loop itself. Distances outside a trace are clamped to its
+    ends, like np.interp, rather than extrapolated.
+    """
+    n1 = d1.shape[0]
+    n2 = d2.shape[0]
+    for i in range(common.shape[0]):
+        x = common[i]
+        
+        x1 = min(max(x, d1[0]), d1[n1 - 1])
+        j = min(max(np.searchsorted(d1, x1, side='right') - 1, 0), n1 - 2)
+        span = d1[j + 1] - d1[j]
+        sp1 = s1[j]
+        if span > 0:
+            sp1 = s1[j] + (s1[j + 1] - s1[j]) * (x1 - d1[j]) / span
+        
+        x2 = min(max(x, d2[0]), d2[n2 - 1])
+        k = min(max(np.searchsorted(d2, x2, side='right') - 1, 0), n2 - 2)
+        span = d2[k + 1] - d2[k]
+        sp2 = s2[k]
+        if span > 0:
+            sp2 = s2[k] + (s2[k + 1] - s2[k]) * (x2 - d2[k]) / span
+        
+        out[i] = sp1 - sp2
+
+
+@njit(cache=True, fastmath=True)
+def distance_and_accel(speed, dt):
+    """
+    Integrate speed (km/h) into distance (m) and difference it into acceleration (km/h/s) in one pass.
+    
+    Args:
+        speed: Speed samples in km/h
+        dt: Seconds since the previous sample, per sample (dt[0] is ignored);
+            FastF1 telemetry is irregularly sampled, so this is not a constant
+    
+    Returns:
+        tuple: (distance, acceleration) float32 arrays
+    """
+    n = speed.shape[0]
+    dist = np.empty(n, dtype=np.float32)
+    accel = np.empty(n, dtype=np.float32)
+    if n == 0:
+        return dist, accel
+    
+    dist[0] = 0.0
+    accel[0] = 0.0
+    for i in range(1, n):
+        dist[i] = dist[i - 1] + speed[i] * dt[i] / 3.6
+        if dt[i] > 0:
+            accel[i] = (speed[i] - speed[i - 1]) / dt[i]
+        else:
+            accel[i] = accel[i - 1]
+    return dist, accel
+
+
+@njit(cache=True, fastmath=True)
+def first_joint_gap(blocks1, blocks2, speed_gap, throttle_gap):
+    """
+    Find the first sample where both the speed and throttle gaps reach their thresholds.
+    
+    Args:
+        blocks1, blocks2: AoSoA channel blocks shaped (n_blocks, 4, block_size),
+            with speed in channel 0 and throttle in channel 1
+        speed_gap: Minimum absolute speed difference
+        throttle_gap: Minimum absolute throttle difference
+    
+    Returns:
+        int: Flat sample index, or -1 if no sample qualifies
+    """
+    n_blocks = blocks1.shape[0]
+    width = blocks1.shape[2]
+    for b in range(n_blocks):
+        for i in range(width):
+            ds = abs(blocks1[b, 0, i] - blocks2[b, 0, i])
+            dt = abs(blocks1[b, 1, i] - blocks2[b, 1, i])
+            if ds >= speed_gap and dt >= throttle_gap:
+                return b * width + i
+    return -1
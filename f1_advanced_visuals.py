@@ -8,12 +8,175 @@ for F1 telemetry data analysis.
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import sample_colorscale
 from plotly.subplots import make_subplots
+from plotly.offline import get_plotlyjs
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import os
+import shutil
+import sys
+
+try:
+    from tsdownsample import LTTBDownsampler
+except ImportError:  # Optional - fall back to uniform striding
+    LTTBDownsampler = None
+
+from _kernels import interp_delta
+
+# Plotly re-validates a figure against its schema on every update; that is only
+# worth paying for while debugging, so it is opt-in via F1_VALIDATE_FIGURES=1
+VALIDATE_FIGURES = os.environ.get('F1_VALIDATE_FIGURES') == '1'
+
+# Single-page viewer: switching panels goes through Plotly.react, which diffs
+# against the current chart instead of rebuilding it like Plotly.newPlot
+COMBINED_VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>F1 Telemetry Visualizations</title>
+<script src="plotly.min.js"></script>
+</head>
+<body>
+<div id="panels">{buttons}</div>
+<div id="chart"></div>
+<script>
+const FIGURES = {{{figures}}};
+window.__rerender = function (figJson) {{
+    Plotly.react('chart', figJson.data, figJson.layout);
+}};
+function showPanel(panelId) {{
+    window.__rerender(FIGURES[panelId]);
+}}
+showPanel('{first_panel}');
+</script>
+</body>
+</html>
+"""
+
+def _is_fresh(path, *sources):
+    """
+    Check that a cache file exists and was written after this module (and any
+    other source files given) last changed.
+    """
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    return all(mtime >= os.path.getmtime(src) for src in (__file__,) + sources if src)
+
+def _cached_html(name):
+    """
+    Memoize a create_* method on the telemetry it plots.
+    
+    The figure JSON and saved HTML are stored under
+    `<output_dir>/.cache/<telemetry hash>-<name>.*`. When both drivers' laps hash
+    the same as a previous run, the cached HTML is copied to the target file
+    and the figure is loaded from JSON instead of being rebuilt.
+    
+    `<output_dir>/.cache/.<name>.key` remembers which telemetry hash the last
+    (year, race, session, driver1, driver2) produced, so re-running the same
+    comparison skips hashing the telemetry too; the identity also carries a cheap
+    telemetry fingerprint and the downsampler in use. Cache entries older than
+    this module or the analyzer's module are ignored.
+    
+    With `defer_write=True` a cache miss builds the figure but leaves writing its
+    HTML and cache entry to the caller: the pending write is appended to
+    `self._deferred_writes` as `(filename, write)`. Cache hits are restored inline.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, save_html=True, show=False, defer_write=False):
+            cache_dir = f"{self.output_dir}/.cache"
+            key_file = f"{cache_dir}/.{name}.key"
+            filename = f"{self.output_dir}/{self.HTML_FILES[name]}"
+            identity = self._session_identity()
+            
+            key = None
+            if identity is not None and os.path.exists(key_file):
+                with open(key_file, encoding='utf-8') as f:
+                    stored_identity, _, stored_key = f.read().partition('\n')
+                if stored_identity == identity:
+                    key = stored_key.strip()
+            if key is None:
+                key = self._telemetry_key()
+            
+            cached_json = f"{cache_dir}/{key}-{name}.json"
+            cached_html = f"{cache_dir}/{key}-{name}.html"
+            
+            source = self._analyzer_source()
+            if (key is not None and _is_fresh(cached_json, source)
+                    and (not save_html or _is_fresh(cached_html, source))):
+                if save_html:
+                    self._ensure_plotlyjs()
+                    shutil.copyfile(cached_html, filename)
+                    print(f"✅ {filename} restored from cache")
+                fig = pio.read_json(cached_json)
+                if show:
+                    fig.show()
+                return fig
+            
+            deferred = save_html and defer_write
+            fig = method(self, save_html and not deferred, show)
+            if fig is None:
+                return None
+            
+            def write():
+                if deferred:
+                    self._write_html(fig, filename)
+                if key is None:
+                    return
+                os.makedirs(cache_dir, exist_ok=True)
+                fig.write_json(cached_json)
+                if save_html:
+                    shutil.copyfile(filename, cached_html)
+                if identity is not None:
+                    with open(key_file, 'w', encoding='utf-8') as f:
+                        f.write(f"{identity}\n{key}")
+            
+            if defer_write:
+                self._deferred_writes.append((filename if deferred else None, write))
+            else:
+                write()
+            return fig
+        return wrapper
+    return decorator
 
 class F1AdvancedVisualizer:
+    # NumPy dtype each cached telemetry channel is converted to
+    CHANNEL_DTYPES = {
+        'Distance': np.float32,
+        'Speed': np.float32,
+        'X': np.float32,
+        'Y': np.float32,
+        'Throttle': np.float32,
+        'RPM': np.float32,
+        'nGear': np.int8,
+        'Brake': np.bool_
+    }
+    
+    # Shared trace line styles; Plotly copies these into each trace it builds
+    _LINE2 = dict(width=2)
+    _LINE3 = dict(width=3)
+    _LINE3_DASH = dict(width=3, dash='dash')
+    
+    # RGB color for each gear 0-8, so the browser doesn't interpolate a colorscale per point
+    GEAR_COLORSCALE = 'RdYlBu_r'
+    GEAR_COLORS = np.asarray(sample_colorscale(GEAR_COLORSCALE, np.linspace(0, 1, 9)), dtype=object)
+    
+    # Output file for each plot, keyed by the name used in the figure cache
+    HTML_FILES = {
+        'speed_distance': 'speed_distance_comparison.html',
+        'track_position': 'track_position_speed.html',
+        'gear_heatmap': 'gear_heatmap.html',
+        'throttle_brake': 'throttle_brake_analysis.html',
+        'speed_delta': 'speed_delta.html',
+        'dashboard': 'comprehensive_dashboard.html'
+    }
+    
     def __init__(self, analyzer):
         """
         Initialize the visualizer with an F1TelemetryAnalyzer instance.
@@ -22,11 +185,229 @@ class F1AdvancedVisualizer:
             analyzer: F1TelemetryAnalyzer instance with loaded data
         """
         self.analyzer = analyzer
+        self._tel = {}
+        self._grid_cache = {}
+        self._deferred_writes = []
         self.output_dir = "f1_visualizations"
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+    
+    def _session_identity(self):
+        """
+        Describe the loaded comparison as a string, or None if it isn't fully known.
+        """
+        if not self.analyzer.driver1_data or not self.analyzer.driver2_data:
+            return None
+        
+        parts = (
+            getattr(self.analyzer, 'year', None),
+            getattr(self.analyzer, 'race', None),
+            getattr(self.analyzer, 'session_type', None),
+            self.analyzer.driver1_data['driver'],
+            self.analyzer.driver2_data['driver']
+        )
+        if any(part is None for part in parts):
+            return None
+        
+        # Cheap fingerprint of what is plotted, so changed telemetry under the same
+        # session identity (or a different downsampler) doesn't reuse old figures
+        fingerprint = []
+        for which in ('d1', 'd2'):
+            distance = self._channels(which)['Distance']
+            fingerprint.append((len(distance), float(distance[0]), float(distance[-1])) if len(distance) else (0,))
+        return repr(parts + tuple(fingerprint) + (self._downsampler_name(),))
     
-    def create_speed_distance_plot(self, save_html=True):
+    @staticmethod
+    def _downsampler_name():
+        """
+        Name the downsampling method in use; it changes what the cached figures contain.
+        """
+        return 'lttb' if LTTBDownsampler is not None else 'stride'
+    
+    def _analyzer_source(self):
+        """
+        Source file of the analyzer's module, or None if it has none.
+        """
+        module = sys.modules.get(type(self.analyzer).__module__)
+        return getattr(module, '__file__', None)
+    
+    def _telemetry_key(self):
+        """
+        Hash both drivers' Distance and Speed samples into a short cache key.
+        """
+        if not self.analyzer.driver1_data or not self.analyzer.driver2_data:
+            return None
+        
+        tel1 = self._channels('d1')
+        tel2 = self._channels('d2')
+        digest = hashlib.blake2b()
+        for driver in (self.analyzer.driver1_data['driver'], self.analyzer.driver2_data['driver']):
+            digest.update(driver.encode())
+        digest.update(self._downsampler_name().encode())
+        for arr in (tel1['Distance'], tel1['Speed'], tel2['Distance'], tel2['Speed']):
+            digest.update(arr.tobytes())
+        return digest.hexdigest()[:16]
+    
+    def _ensure_plotlyjs(self):
+        """
+        Write the shared plotly.min.js into the output directory if it is missing.
+        
+        Doing this up front means concurrent HTML writes never race to copy the
+        bundle, and HTML restored from the cache still finds it.
+        """
+        bundle = f"{self.output_dir}/plotly.min.js"
+        if not os.path.exists(bundle):
+            with open(bundle, 'w', encoding='utf-8') as f:
+                f.write(get_plotlyjs())
+    
+    @staticmethod
+    def _write_html(fig, filename):
+        """
+        Write a figure to HTML that loads a plotly.min.js shared by the output directory.
+        
+        The first write into a directory copies the bundle next to the HTML file,
+        later writes only reference it.
+        """
+        fig.write_html(
+            filename,
+            include_plotlyjs='directory',
+            full_html=True,
+            include_mathjax=False,
+            auto_open=False,
+            config={'responsive': True},
+            validate=VALIDATE_FIGURES
+        )
+    
+    def _channels(self, which):
+        """
+        Get the cached NumPy arrays of a driver's telemetry channels.
+        
+        Args:
+            which: 'd1' for the analyzer's driver1_data, 'd2' for driver2_data
+        
+        Returns:
+            dict: Channel name to contiguous NumPy array (see CHANNEL_DTYPES)
+        """
+        driver_data = self.analyzer.driver1_data if which == 'd1' else self.analyzer.driver2_data
+        tel = driver_data['telemetry']
+        
+        # Rebuild when the analyzer has loaded a different lap since the last call
+        cached = self._tel.get(which)
+        if cached is None or cached[0] is not tel:
+            channels = {
+                col: self._arr(tel[col], dtype)
+                for col, dtype in self.CHANNEL_DTYPES.items()
+                if col in tel.columns
+            }
+            cached = self._tel[which] = (tel, channels)
+        return cached[1]
+    
+    def _common_grid(self, min_distance, max_distance, n_points=500):
+        """
+        Get the evenly spaced distance grid that both drivers are interpolated onto.
+        
+        Grids are cached per (start, end, size) with the ends rounded inwards to
+        0.1 m, so laps on the same track share one array and the grid never
+        reaches past the overlap of both laps.
+        """
+        key = (np.ceil(float(min_distance) * 10) / 10, np.floor(float(max_distance) * 10) / 10, n_points)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            grid = self._grid_cache[key] = np.linspace(key[0], key[1], n_points, dtype=np.float32)
+        return grid
+    
+    @staticmethod
+    def _arr(series, dtype=np.float32):
+        """
+        Convert a telemetry column to a contiguous NumPy array of the given dtype.
+        
+        Plotly transports typed NumPy arrays as base64 instead of JSON lists.
+        """
+        return np.ascontiguousarray(series.to_numpy(dtype=dtype, copy=False))
+    
+    @staticmethod
+    def _brake_pct(brake):
+        """
+        Convert the boolean Brake channel to an int8 0/100 percentage array.
+        """
+        return np.asarray(brake, dtype=np.bool_).view(np.int8) * np.int8(100)
+    
+    @staticmethod
+    def _concat_with_gap(a, b):
+        """
+        Join two series into one float32 array with a NaN in between.
+        
+        Plotly breaks the line at the NaN, so two drivers can share a single trace.
+        """
+        return np.concatenate([a, [np.nan], b]).astype(np.float32)
+    
+    @staticmethod
+    def _downsample_index(x, y, n_out=1500):
+        """
+        Pick the indices of at most n_out samples that represent the (x, y) series.
+        
+        Uses LTTB from tsdownsample when installed, otherwise evenly strided samples.
+        """
+        n = len(x)
+        if n <= n_out:
+            return np.arange(n)
+        if LTTBDownsampler is not None:
+            return LTTBDownsampler().downsample(np.asarray(x), np.asarray(y), n_out=n_out)
+        return np.linspace(0, n - 1, n_out).astype(np.intp)
+    
+    @classmethod
+    def _downsample(cls, x, y, n_out=1500):
+        """
+        Reduce an (x, y) series to roughly screen resolution before plotting.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        idx = cls._downsample_index(x, y, n_out)
+        return x[idx], y[idx]
+    
+    @staticmethod
+    def _simplify_index(x, y, tolerance=None):
+        """
+        Douglas-Peucker simplification of a track path, returning the kept indices.
+        
+        Straights collapse to a few points while corners keep their detail.
+        The default tolerance is 0.1% of the track's bounding box diagonal.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n = len(x)
+        if n < 3:
+            return np.arange(n)
+        if tolerance is None:
+            tolerance = 1e-3 * np.hypot(np.ptp(x), np.ptp(y))
+        
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, n - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            dx = x[end] - x[start]
+            dy = y[end] - y[start]
+            px_ = x[start + 1:end] - x[start]
+            py_ = y[start + 1:end] - y[start]
+            norm = np.hypot(dx, dy)
+            if norm == 0:
+                # Closed lap: start and end coincide, use distance to the point
+                dist = np.hypot(px_, py_)
+            else:
+                dist = np.abs(dx * py_ - dy * px_) / norm
+            i = int(np.argmax(dist))
+            if dist[i] > tolerance:
+                mid = start + 1 + i
+                keep[mid] = True
+                stack.append((start, mid))
+                stack.append((mid, end))
+        
+        return np.flatnonzero(keep)
+    
+    @_cached_html('speed_distance')
+    def create_speed_distance_plot(self, save_html=True, show=False):
         """
         Create interactive speed vs distance plot.
         """
@@ -34,17 +415,42 @@ class F1AdvancedVisualizer:
             print("❌ No data available for plotting")
             return None
         
-        fig = px.line(
-            self.analyzer.combined_data, 
-            x='Distance', 
-            y='Speed', 
-            color='Driver',
-            title='Speed vs Distance Comparison',
-            labels={'Speed': 'Speed (km/h)', 'Distance': 'Distance (m)'},
-            hover_data=['Time', 'nGear', 'Throttle', 'Brake']
-        )
+        # Keep only the columns the figure uses
+        columns = ['Distance', 'Speed', 'Driver', 'Time', 'nGear', 'Throttle', 'Brake']
+        data = self.analyzer.combined_data[columns]
+        
+        fig = go.Figure()
+        
+        for driver, driver_data in data.groupby('Driver', sort=False, observed=True):
+            distance = self._arr(driver_data['Distance'])
+            speed = self._arr(driver_data['Speed'])
+            
+            # Downsample each driver's lap to screen resolution
+            idx = self._downsample_index(distance, speed)
+            
+            # Lap time (s), gear, throttle and brake for the hover label
+            customdata = np.column_stack([
+                pd.to_timedelta(driver_data['Time']).dt.total_seconds().to_numpy(np.float32)[idx],
+                self._arr(driver_data['nGear'], np.int8)[idx],
+                self._arr(driver_data['Throttle'])[idx],
+                self._brake_pct(driver_data['Brake'])[idx]
+            ]).astype(np.float32)
+            
+            fig.add_trace(go.Scattergl(
+                x=distance[idx],
+                y=speed[idx],
+                customdata=customdata,
+                mode='lines',
+                name=driver,
+                hovertemplate=(
+                    'Speed: %{y:.1f} km/h<br>Time: %{customdata[0]:.3f}s<br>'
+                    'Gear: %{customdata[1]}<br>Throttle: %{customdata[2]:.0f}%<br>'
+                    'Brake: %{customdata[3]:.0f}%'
+                )
+            ))
         
         fig.update_layout(
+            title='Speed vs Distance Comparison',
             template='plotly_white',
             hovermode='x unified',
             xaxis_title='Distance (m)',
@@ -53,16 +459,18 @@ class F1AdvancedVisualizer:
             height=600
         )
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/speed_distance_comparison.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['speed_distance']}"
+            self._write_html(fig, filename)
             print(f"✅ Speed vs Distance plot saved as {filename}")
         
         return fig
     
-    def create_track_position_plot(self, save_html=True):
+    @_cached_html('track_position')
+    def create_track_position_plot(self, save_html=True, show=False):
         """
         Create track position plot with speed coloring.
         """
@@ -73,29 +481,35 @@ class F1AdvancedVisualizer:
         fig = go.Figure()
         
         # Add driver 1 track position with speed coloring
-        tel1 = self.analyzer.driver1_data['telemetry']
-        fig.add_trace(go.Scatter(
-            x=tel1['X'],
-            y=tel1['Y'],
+        tel1 = self._channels('d1')
+        x1, y1 = tel1['X'], tel1['Y']
+        # Every marker carries its own speed colour, so pick points on the speed trace
+        # (Douglas-Peucker on X/Y alone would drop a straight's whole speed ramp)
+        idx1 = self._downsample_index(tel1['Distance'], tel1['Speed'])
+        fig.add_trace(go.Scattergl(
+            x=x1[idx1],
+            y=y1[idx1],
             mode='markers+lines',
             marker=dict(
-                color=tel1['Speed'],
+                color=tel1['Speed'][idx1],
                 colorscale='Viridis',
                 size=4,
                 colorbar=dict(title='Speed (km/h)', x=1.02)
             ),
-            line=dict(width=3),
+            line=self._LINE3,
             name=f"{self.analyzer.driver1_data['driver']} Track + Speed",
             hovertemplate='X: %{x}<br>Y: %{y}<br>Speed: %{marker.color} km/h<extra></extra>'
         ))
         
         # Add driver 2 track position
-        tel2 = self.analyzer.driver2_data['telemetry']
-        fig.add_trace(go.Scatter(
-            x=tel2['X'],
-            y=tel2['Y'],
+        tel2 = self._channels('d2')
+        x2, y2 = tel2['X'], tel2['Y']
+        idx2 = self._simplify_index(x2, y2)
+        fig.add_trace(go.Scattergl(
+            x=x2[idx2],
+            y=y2[idx2],
             mode='lines',
-            line=dict(width=3, dash='dash'),
+            line=self._LINE3_DASH,
             name=f"{self.analyzer.driver2_data['driver']} Track",
             hovertemplate='X: %{x}<br>Y: %{y}<extra></extra>'
         ))
@@ -110,16 +524,18 @@ class F1AdvancedVisualizer:
             xaxis=dict(scaleanchor="y", scaleratio=1)
         )
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/track_position_speed.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['track_position']}"
+            self._write_html(fig, filename)
             print(f"✅ Track position plot saved as {filename}")
         
         return fig
     
-    def create_gear_heatmap(self, save_html=True):
+    @_cached_html('gear_heatmap')
+    def create_gear_heatmap(self, save_html=True, show=False):
         """
         Create gear usage heatmap over track position.
         """
@@ -137,39 +553,56 @@ class F1AdvancedVisualizer:
         )
         
         # Driver 1 gear heatmap
-        tel1 = self.analyzer.driver1_data['telemetry']
+        tel1 = self._channels('d1')
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=tel1['X'],
                 y=tel1['Y'],
                 mode='markers',
                 marker=dict(
-                    color=tel1['nGear'],
-                    colorscale='RdYlBu_r',
-                    size=6,
-                    colorbar=dict(title='Gear', x=0.48)
+                    color=self.GEAR_COLORS[np.clip(tel1['nGear'], 0, 8)],
+                    size=6
                 ),
+                customdata=tel1['nGear'],
                 name=f"{self.analyzer.driver1_data['driver']} Gear",
-                hovertemplate='X: %{x}<br>Y: %{y}<br>Gear: %{marker.color}<extra></extra>'
+                hovertemplate='X: %{x}<br>Y: %{y}<br>Gear: %{customdata}<extra></extra>'
             ),
             row=1, col=1
         )
         
         # Driver 2 gear heatmap
-        tel2 = self.analyzer.driver2_data['telemetry']
+        tel2 = self._channels('d2')
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=tel2['X'],
                 y=tel2['Y'],
                 mode='markers',
                 marker=dict(
-                    color=tel2['nGear'],
-                    colorscale='RdYlBu_r',
-                    size=6,
-                    colorbar=dict(title='Gear', x=1.02)
+                    color=self.GEAR_COLORS[np.clip(tel2['nGear'], 0, 8)],
+                    size=6
                 ),
+                customdata=tel2['nGear'],
                 name=f"{self.analyzer.driver2_data['driver']} Gear",
-                hovertemplate='X: %{x}<br>Y: %{y}<br>Gear: %{marker.color}<extra></extra>'
+                hovertemplate='X: %{x}<br>Y: %{y}<br>Gear: %{customdata}<extra></extra>'
+            ),
+            row=1, col=2
+        )
+        
+        # Empty trace that only draws the shared gear colorbar
+        fig.add_trace(
+            go.Scattergl(
+                x=[None],
+                y=[None],
+                mode='markers',
+                marker=dict(
+                    color=[0],
+                    colorscale=self.GEAR_COLORSCALE,
+                    cmin=0,
+                    cmax=8,
+                    showscale=True,
+                    colorbar=dict(title='Gear', x=1.02)
+                ),
+                hoverinfo='skip'
             ),
             row=1, col=2
         )
@@ -184,16 +617,18 @@ class F1AdvancedVisualizer:
         fig.update_xaxes(title_text="X Position (m)", scaleanchor="y", scaleratio=1)
         fig.update_yaxes(title_text="Y Position (m)")
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/gear_heatmap.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['gear_heatmap']}"
+            self._write_html(fig, filename)
             print(f"✅ Gear heatmap saved as {filename}")
         
         return fig
     
-    def create_throttle_brake_analysis(self, save_html=True):
+    @_cached_html('throttle_brake')
+    def create_throttle_brake_analysis(self, save_html=True, show=False):
         """
         Create throttle and brake analysis plots.
         """
@@ -206,33 +641,34 @@ class F1AdvancedVisualizer:
             subplot_titles=('Throttle vs Distance', 'Brake vs Distance'),
             vertical_spacing=0.1
         )
+        fig._validate = VALIDATE_FIGURES
         
         # Separate data by driver
-        for driver in self.analyzer.combined_data['Driver'].unique():
-            driver_data = self.analyzer.combined_data[self.analyzer.combined_data['Driver'] == driver]
-            
+        for driver, driver_data in self.analyzer.combined_data.groupby('Driver', sort=False, observed=True):
             # Throttle plot
+            x, y = self._downsample(self._arr(driver_data['Distance']), self._arr(driver_data['Throttle']))
             fig.add_trace(
-                go.Scatter(
-                    x=driver_data['Distance'],
-                    y=driver_data['Throttle'],
+                go.Scattergl(
+                    x=x,
+                    y=y,
                     mode='lines',
                     name=f'{driver} Throttle',
-                    line=dict(width=2),
+                    line=self._LINE2,
                     hovertemplate='Distance: %{x}m<br>Throttle: %{y}%<extra></extra>'
                 ),
                 row=1, col=1
             )
             
             # Brake plot (convert boolean to numeric)
-            brake_numeric = driver_data['Brake'].astype(int) * 100
+            brake_numeric = self._brake_pct(driver_data['Brake'])
+            x, y = self._downsample(self._arr(driver_data['Distance']), brake_numeric)
             fig.add_trace(
-                go.Scatter(
-                    x=driver_data['Distance'],
-                    y=brake_numeric,
+                go.Scattergl(
+                    x=x,
+                    y=y,
                     mode='lines',
                     name=f'{driver} Brake',
-                    line=dict(width=2),
+                    line=self._LINE2,
                     hovertemplate='Distance: %{x}m<br>Braking: %{y}%<extra></extra>'
                 ),
                 row=2, col=1
@@ -249,16 +685,18 @@ class F1AdvancedVisualizer:
         fig.update_yaxes(title_text="Throttle (%)", row=1, col=1)
         fig.update_yaxes(title_text="Brake (%)", row=2, col=1)
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/throttle_brake_analysis.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['throttle_brake']}"
+            self._write_html(fig, filename)
             print(f"✅ Throttle/Brake analysis saved as {filename}")
         
         return fig
     
-    def create_speed_delta_plot(self, save_html=True):
+    @_cached_html('speed_delta')
+    def create_speed_delta_plot(self, save_html=True, show=False):
         """
         Create speed delta plot showing where each driver is faster.
         """
@@ -266,26 +704,31 @@ class F1AdvancedVisualizer:
             print("❌ No driver data available for plotting")
             return None
         
-        tel1 = self.analyzer.driver1_data['telemetry']
-        tel2 = self.analyzer.driver2_data['telemetry']
+        tel1 = self._channels('d1')
+        tel2 = self._channels('d2')
         
         # Interpolate to common distance points
-        min_distance = max(tel1['Distance'].min(), tel2['Distance'].min())
-        max_distance = min(tel1['Distance'].max(), tel2['Distance'].max())
-        common_distance = np.linspace(min_distance, max_distance, 500)
+        dist1, dist2 = tel1['Distance'], tel2['Distance']
+        min_distance = max(dist1.min(), dist2.min())
+        max_distance = min(dist1.max(), dist2.max())
+        common_distance = self._common_grid(min_distance, max_distance)
         
-        speed1_interp = np.interp(common_distance, tel1['Distance'], tel1['Speed'])
-        speed2_interp = np.interp(common_distance, tel2['Distance'], tel2['Speed'])
+        speed_delta = np.empty_like(common_distance)
+        interp_delta(common_distance, dist1, tel1['Speed'],
+                      dist2, tel2['Speed'], speed_delta)
         
-        speed_delta = speed1_interp - speed2_interp
+        # NaN out the other driver's region so each trace breaks there instead of
+        # being split out with boolean masks; both traces share the same x array
+        positive_delta = np.where(speed_delta >= 0, speed_delta, np.nan)
+        negative_delta = np.where(speed_delta < 0, speed_delta, np.nan)
         
         fig = go.Figure()
         
         # Positive delta (driver1 faster)
-        positive_mask = speed_delta >= 0
-        fig.add_trace(go.Scatter(
-            x=common_distance[positive_mask],
-            y=speed_delta[positive_mask],
+        fig.add_trace(go.Scattergl(
+            x=common_distance,
+            y=positive_delta,
+            connectgaps=False,
             mode='lines',
             fill='tozeroy',
             fillcolor='rgba(0, 255, 0, 0.3)',
@@ -295,10 +738,10 @@ class F1AdvancedVisualizer:
         ))
         
         # Negative delta (driver2 faster)
-        negative_mask = speed_delta < 0
-        fig.add_trace(go.Scatter(
-            x=common_distance[negative_mask],
-            y=speed_delta[negative_mask],
+        fig.add_trace(go.Scattergl(
+            x=common_distance,
+            y=negative_delta,
+            connectgaps=False,
             mode='lines',
             fill='tozeroy',
             fillcolor='rgba(255, 0, 0, 0.3)',
@@ -319,16 +762,18 @@ class F1AdvancedVisualizer:
             hovermode='x unified'
         )
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/speed_delta.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['speed_delta']}"
+            self._write_html(fig, filename)
             print(f"✅ Speed delta plot saved as {filename}")
         
         return fig
     
-    def create_comprehensive_dashboard(self, save_html=True):
+    @_cached_html('dashboard')
+    def create_comprehensive_dashboard(self, save_html=True, show=False):
         """
         Create a comprehensive dashboard with multiple visualizations.
         """
@@ -355,60 +800,82 @@ class F1AdvancedVisualizer:
             vertical_spacing=0.08,
             horizontal_spacing=0.08
         )
+        fig._validate = VALIDATE_FIGURES
         
         # Get data
-        tel1 = self.analyzer.driver1_data['telemetry']
-        tel2 = self.analyzer.driver2_data['telemetry']
+        tel1 = self._channels('d1')
+        tel2 = self._channels('d2')
         
         # 1. Speed vs Distance
-        fig.add_trace(go.Scatter(x=tel1['Distance'], y=tel1['Speed'], 
+        x1, y1 = self._downsample(tel1['Distance'], tel1['Speed'])
+        fig.add_trace(go.Scattergl(x=x1, y=y1,
                                 name=f"{self.analyzer.driver1_data['driver']} Speed",
-                                line=dict(width=2)), row=1, col=1)
-        fig.add_trace(go.Scatter(x=tel2['Distance'], y=tel2['Speed'], 
+                                line=self._LINE2), row=1, col=1)
+        x2, y2 = self._downsample(tel2['Distance'], tel2['Speed'])
+        fig.add_trace(go.Scattergl(x=x2, y=y2,
                                 name=f"{self.analyzer.driver2_data['driver']} Speed",
-                                line=dict(width=2)), row=1, col=1)
+                                line=self._LINE2), row=1, col=1)
         
         # 2. Track Position
-        fig.add_trace(go.Scatter(x=tel1['X'], y=tel1['Y'], mode='lines',
+        x1, y1 = tel1['X'], tel1['Y']
+        x2, y2 = tel2['X'], tel2['Y']
+        idx1 = self._simplify_index(x1, y1)
+        idx2 = self._simplify_index(x2, y2)
+        fig.add_trace(go.Scattergl(x=x1[idx1], y=y1[idx1], mode='lines',
                                 name=f"{self.analyzer.driver1_data['driver']} Track",
-                                line=dict(width=3)), row=1, col=2)
-        fig.add_trace(go.Scatter(x=tel2['X'], y=tel2['Y'], mode='lines',
+                                line=self._LINE3), row=1, col=2)
+        fig.add_trace(go.Scattergl(x=x2[idx2], y=y2[idx2], mode='lines',
                                 name=f"{self.analyzer.driver2_data['driver']} Track",
-                                line=dict(width=3, dash='dash')), row=1, col=2)
+                                line=self._LINE3_DASH), row=1, col=2)
         
         # 3. Throttle
-        fig.add_trace(go.Scatter(x=tel1['Distance'], y=tel1['Throttle'],
+        x1, y1 = self._downsample(tel1['Distance'], tel1['Throttle'])
+        fig.add_trace(go.Scattergl(x=x1, y=y1,
                                 name=f"{self.analyzer.driver1_data['driver']} Throttle",
-                                line=dict(width=2)), row=2, col=1)
-        fig.add_trace(go.Scatter(x=tel2['Distance'], y=tel2['Throttle'],
+                                line=self._LINE2), row=2, col=1)
+        x2, y2 = self._downsample(tel2['Distance'], tel2['Throttle'])
+        fig.add_trace(go.Scattergl(x=x2, y=y2,
                                 name=f"{self.analyzer.driver2_data['driver']} Throttle",
-                                line=dict(width=2)), row=2, col=1)
-        
-        # 4. Gear Usage
-        fig.add_trace(go.Scatter(x=tel1['Distance'], y=tel1['nGear'],
-                                name=f"{self.analyzer.driver1_data['driver']} Gear",
-                                mode='lines+markers', line=dict(width=2)), row=2, col=2)
-        fig.add_trace(go.Scatter(x=tel2['Distance'], y=tel2['nGear'],
-                                name=f"{self.analyzer.driver2_data['driver']} Gear",
-                                mode='lines+markers', line=dict(width=2)), row=2, col=2)
+                                line=self._LINE2), row=2, col=1)
+        
+        # 4. Gear Usage - one trace for both drivers, NaN-separated and told apart
+        # by marker color
+        driver1 = self.analyzer.driver1_data['driver']
+        driver2 = self.analyzer.driver2_data['driver']
+        x1, y1 = self._downsample(tel1['Distance'], tel1['nGear'])
+        x2, y2 = self._downsample(tel2['Distance'], tel2['nGear'])
+        color1, color2 = px.colors.qualitative.Plotly[:2]
+        fig.add_trace(go.Scattergl(x=self._concat_with_gap(x1, x2),
+                                y=self._concat_with_gap(y1, y2),
+                                customdata=np.array([driver1] * len(x1) + [''] + [driver2] * len(x2)),
+                                marker=dict(color=self._concat_with_gap(np.zeros(len(x1)), np.ones(len(x2))),
+                                            colorscale=[[0, color1], [1, color2]],
+                                            cmin=0, cmax=1, size=4),
+                                name=f"{driver1} / {driver2} Gear",
+                                hovertemplate='%{customdata}<br>Distance: %{x}m<br>Gear: %{y}<extra></extra>',
+                                mode='lines+markers', line=dict(width=1, color='lightgray')), row=2, col=2)
         
         # 5. RPM
-        fig.add_trace(go.Scatter(x=tel1['Distance'], y=tel1['RPM'],
+        x1, y1 = self._downsample(tel1['Distance'], tel1['RPM'])
+        fig.add_trace(go.Scattergl(x=x1, y=y1,
                                 name=f"{self.analyzer.driver1_data['driver']} RPM",
-                                line=dict(width=2)), row=3, col=1)
-        fig.add_trace(go.Scatter(x=tel2['Distance'], y=tel2['RPM'],
+                                line=self._LINE2), row=3, col=1)
+        x2, y2 = self._downsample(tel2['Distance'], tel2['RPM'])
+        fig.add_trace(go.Scattergl(x=x2, y=y2,
                                 name=f"{self.analyzer.driver2_data['driver']} RPM",
-                                line=dict(width=2)), row=3, col=1)
+                                line=self._LINE2), row=3, col=1)
         
         # 6. Brake Points
-        brake1 = tel1['Brake'].astype(int) * 100
-        brake2 = tel2['Brake'].astype(int) * 100
-        fig.add_trace(go.Scatter(x=tel1['Distance'], y=brake1,
+        brake1 = self._brake_pct(tel1['Brake'])
+        brake2 = self._brake_pct(tel2['Brake'])
+        x1, y1 = self._downsample(tel1['Distance'], brake1)
+        fig.add_trace(go.Scattergl(x=x1, y=y1,
                                 name=f"{self.analyzer.driver1_data['driver']} Brake",
-                                line=dict(width=2)), row=3, col=2)
-        fig.add_trace(go.Scatter(x=tel2['Distance'], y=brake2,
+                                line=self._LINE2), row=3, col=2)
+        x2, y2 = self._downsample(tel2['Distance'], brake2)
+        fig.add_trace(go.Scattergl(x=x2, y=y2,
                                 name=f"{self.analyzer.driver2_data['driver']} Brake",
-                                line=dict(width=2)), row=3, col=2)
+                                line=self._LINE2), row=3, col=2)
         
         # Update layout
         fig.update_layout(
@@ -433,29 +900,82 @@ class F1AdvancedVisualizer:
         fig.update_yaxes(title_text="RPM", row=3, col=1)
         fig.update_yaxes(title_text="Brake (%)", row=3, col=2)
         
-        fig.show()
+        if show:
+            fig.show()
         
         if save_html:
-            filename = f"{self.output_dir}/comprehensive_dashboard.html"
-            fig.write_html(filename)
+            filename = f"{self.output_dir}/{self.HTML_FILES['dashboard']}"
+            self._write_html(fig, filename)
             print(f"✅ Comprehensive dashboard saved as {filename}")
         
         return fig
     
-    def generate_all_visualizations(self):
+    def create_combined_viewer(self, figures, filename="all_visualizations.html"):
+        """
+        Write a single HTML page holding every figure, switched with Plotly.react.
+        
+        Args:
+            figures: Dict mapping panel id to a Plotly figure (None entries are skipped)
+            filename: Name of the HTML file inside the output directory
+        """
+        figures = {panel: fig for panel, fig in figures.items() if fig is not None}
+        if not figures:
+            print("❌ No figures available for the combined viewer")
+            return None
+        
+        buttons = "".join(
+            f'<button onclick="showPanel(\'{panel}\')">{panel.replace("_", " ").title()}</button>'
+            for panel in figures
+        )
+        figures_js = ", ".join(f'"{panel}": {fig.to_json()}' for panel, fig in figures.items())
+        html = COMBINED_VIEWER_TEMPLATE.format(
+            buttons=buttons,
+            figures=figures_js,
+            first_panel=next(iter(figures))
+        )
+        
+        # Like the other pages, load the plotly.min.js shared by the output directory so it works offline
+        self._ensure_plotlyjs()
+        path = f"{self.output_dir}/{filename}"
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"✅ Combined viewer saved as {path}")
+        return path
+    
+    def generate_all_visualizations(self, show=False):
         """
         Generate all available visualizations.
+        
+        Args:
+            show: Whether to also open each figure in the browser
         """
         print(f"\n📈 Generating Advanced F1 Visualizations...")
         print(f"Output directory: {self.output_dir}")
         print("=" * 60)
         
-        self.create_speed_distance_plot()
-        self.create_track_position_plot()
-        self.create_gear_heatmap()
-        self.create_throttle_brake_analysis()
-        self.create_speed_delta_plot()
-        self.create_comprehensive_dashboard()
+        self._ensure_plotlyjs()
+        
+        # Cached figures restore their HTML straight away; cache misses queue their
+        # HTML and cache writes, which are I/O heavy, to overlap across threads below
+        self._deferred_writes = []
+        opts = dict(save_html=True, show=show, defer_write=True)
+        figures = {
+            'speed_distance': self.create_speed_distance_plot(**opts),
+            'track_position': self.create_track_position_plot(**opts),
+            'gear_heatmap': self.create_gear_heatmap(**opts),
+            'throttle_brake': self.create_throttle_brake_analysis(**opts),
+            'speed_delta': self.create_speed_delta_plot(**opts),
+            'dashboard': self.create_comprehensive_dashboard(**opts)
+        }
+        
+        writes, self._deferred_writes = self._deferred_writes, []
+        with ThreadPoolExecutor(max_workers=min(6, os.cpu_count() or 1)) as executor:
+            list(executor.map(lambda pending: pending[1](), writes))
+        for filename, _ in writes:
+            if filename is not None:
+                print(f"✅ Saved {filename}")
+        
+        self.create_combined_viewer(figures)
         
         print("\n" + "=" * 60)
         print("✅ All visualizations generated successfully!")
@@ -142,9 +142,9 @@ def check_generated_files():
     print("📄 GENERATED FILES STATUS:")
     print("=" * 40)
     
-    # Check for CSV files
-    csv_files = [f for f in os.listdir('.') if f.startswith('f1_') and f.endswith('.csv')]
-    print(f"CSV Data Files: {len(csv_files)} found")
+    # Check for CSV / Parquet data files
+    csv_files = [f for f in os.listdir('.') if f.startswith('f1_') and f.endswith(('.csv', '.parquet'))]
+    print(f"CSV/Parquet Data Files: {len(csv_files)} found")
     for f in csv_files[:3]:  # Show first 3
         print(f"  • {f}")
     if len(csv_files) > 3:
@@ -9,26 +9,162 @@ comparing two drivers' fastest laps side by side.
 import fastf1
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import warnings
+import json
+import atexit
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Tuple, Dict, Any
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
-# Enable FastF1 cache to speed up data loading
 import os
-cache_dir = 'f1_cache'
-if not os.path.exists(cache_dir):
-    os.makedirs(cache_dir)
-fastf1.Cache.enable_cache(cache_dir)
+import sys
+
+# FastF1 cache directory, enabled on first analyzer construction rather than at import
+CACHE_DIR = 'f1_cache'
+_cache_ready = False
+
+def _ensure_cache():
+    """
+    Enable the FastF1 cache to speed up data loading, once per process.
+    """
+    global _cache_ready
+    if _cache_ready:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fastf1.Cache.enable_cache(CACHE_DIR)
+    _cache_ready = True
+
+@functools.lru_cache(maxsize=None)
+def _has_parquet_engine() -> bool:
+    """
+    Whether pandas can read and write Parquet (pyarrow or fastparquet is an optional dependency).
+    """
+    return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+@functools.lru_cache(maxsize=None)
+def _has_pyarrow() -> bool:
+    """
+    Whether the optional pyarrow package, needed by the lap cache, is installed.
+    """
+    return importlib.util.find_spec('pyarrow') is not None
+
+# One pool for background figure writes, shared by every analyzer and drained before exit
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+# Matplotlib backends that never draw on screen, so a figure can be saved off the main thread
+_NON_INTERACTIVE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+@dataclass
+class LapTelemetry:
+    """
+    One driver's fastest lap stored as a contiguous array per telemetry channel.
+    
+    Per-channel passes (plots, reductions) stream a single float32 buffer
+    instead of going through the telemetry DataFrame.
+    """
+    speed: np.ndarray
+    throttle: np.ndarray
+    brake: np.ndarray
+    distance: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    n_gear: np.ndarray
+    lap_time: pd.Timedelta
+    lap_number: float
+    driver: str
+    team: str
+    
+    @classmethod
+    def from_telemetry(cls, telemetry: pd.DataFrame, driver: str, lap) -> 'LapTelemetry':
+        """
+        Build the per-channel arrays from a FastF1 telemetry frame and its lap.
+        """
+        return cls(
+            speed=telemetry['Speed'].to_numpy(np.float32),
+            throttle=telemetry['Throttle'].to_numpy(np.float32),
+            brake=telemetry['Brake'].to_numpy(np.float32),
+            distance=telemetry['Distance'].to_numpy(np.float32),
+            x=telemetry['X'].to_numpy(np.float32),
+            y=telemetry['Y'].to_numpy(np.float32),
+            n_gear=telemetry['nGear'].to_numpy(np.int8),
+            lap_time=lap['LapTime'],
+            lap_number=lap['LapNumber'],
+            driver=driver,
+            team=lap['Team']
+        )
 
 class F1TelemetryAnalyzer:
+    # Telemetry columns read by the analyzer and the visualizers; the rest are dropped at ingest
+    INGEST_COLUMNS = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'nGear', 'RPM', 'X', 'Y']
+    
+    # Narrowest dtype each telemetry channel fits in; FastF1 returns float64/int64
+    INGEST_DTYPES = {
+        'Speed': 'float32',
+        'Throttle': 'float32',
+        'X': 'float32',
+        'Y': 'float32',
+        'Distance': 'float32',
+        'RPM': 'float32',
+        'nGear': 'int8',
+        'Brake': 'bool'
+    }
+    
+    # Bump when ingest changes what a cached lap holds beyond INGEST_COLUMNS/INGEST_DTYPES
+    # (e.g. how a derived channel like Acceleration is computed)
+    TEL_CACHE_VERSION = 1
+    
+    # Number of points on the shared distance grid both laps are resampled onto
+    RESAMPLE_POINTS = 4096
+    
+    # Resampled channels are packed AoSoA as (RESAMPLE_POINTS // BLOCK_SIZE, 4, BLOCK_SIZE),
+    # channel order speed, throttle, brake, gear
+    BLOCK_SIZE = 64
+    
     def __init__(self):
+        _ensure_cache()
         self.session = None
+        self.year = None
+        self.race = None
+        self.session_type = None
+        self._laps_by_driver = {}
         self.driver1_data = None
         self.driver2_data = None
         self.combined_data = None
+        self.distance_grid = None
+        self._tel_cache_dir = 'f1_tel_cache'
+        # Plotting libraries are imported on first use so analysis-only runs skip them
+        self._plt = None
+        self._plotly = None
+        # (filename, future) for figure saves still running on _IO_POOL
+        self._pending_saves = []
+    
+    def _pyplot(self):
+        """
+        Import matplotlib.pyplot on first use and cache the module.
+        """
+        if self._plt is None:
+            import matplotlib.pyplot as plt
+            self._plt = plt
+        return self._plt
+    
+    def _plotly_modules(self):
+        """
+        Import plotly.express and plotly.graph_objects on first use and cache them.
+        
+        Returns:
+            tuple: (plotly.express, plotly.graph_objects)
+        """
+        if self._plotly is None:
+            import plotly.express as px
+            import plotly.graph_objects as go
+            self._plotly = (px, go)
+        return self._plotly
     
     def load_session(self, year: int, race: str, session_type: str) -> bool:
         """
@@ -46,6 +182,8 @@ class F1TelemetryAnalyzer:
             print(f"Loading {year} {race} {session_type} session...")
             self.session = fastf1.get_session(year, race, session_type)
             self.session.load()
+            self.year, self.race, self.session_type = year, race, session_type
+            self._laps_by_driver = self._group_laps_by_driver(self.session.laps)
             print(f"✅ Session loaded successfully!")
             print(f"Available drivers: {list(self.session.drivers)}")
             return True
@@ -53,10 +191,129 @@ class F1TelemetryAnalyzer:
             print(f"❌ Error loading session: {e}")
             return False
     
+    @staticmethod
+    def _group_laps_by_driver(laps) -> Dict[str, Any]:
+        """
+        Split the session laps by driver once instead of re-scanning them per lookup.
+        
+        Like Laps.pick_driver, each driver's laps can be looked up by abbreviation
+        ('VER') or by car number ('1').
+        """
+        laps_by_driver = {}
+        for drv, grp in laps.groupby('Driver', sort=False):
+            laps_by_driver[drv] = grp
+            if 'DriverNumber' in grp.columns:
+                for number in grp['DriverNumber'].dropna().unique():
+                    laps_by_driver[str(number)] = grp
+        return laps_by_driver
+    
+    def _tel_cache_path(self, driver: str):
+        """
+        Path of the processed fastest-lap cache file for a driver in the loaded session.
+        
+        Returns None when the session isn't identified by year, race and session type
+        (e.g. set without load_session), since the key could then collide across sessions.
+        """
+        if any(part is None for part in (self.year, self.race, self.session_type)):
+            return None
+        key = f"{self.year}_{self.race}_{self.session_type}_{driver}.arrow"
+        return os.path.join(self._tel_cache_dir, key)
+    
+    def _tel_cache_schema(self) -> Dict[str, Any]:
+        """
+        Describe the layout of a cached lap; entries with a different layout are ignored.
+        """
+        return {
+            'version': self.TEL_CACHE_VERSION,
+            'columns': self.INGEST_COLUMNS + ['Acceleration'],
+            'dtypes': self.INGEST_DTYPES
+        }
+    
+    def _load_cached_lap(self, driver: str):
+        """
+        Load a previously processed fastest lap from the telemetry cache.
+        
+        Returns:
+            tuple: (telemetry, lap) where lap holds LapTime, LapNumber and Team,
+            or None if the lap is not cached or cannot be read
+        """
+        if not _has_pyarrow():
+            return None
+        
+        path = self._tel_cache_path(driver)
+        if path is None:
+            return None
+        meta_path = path[:-len('.arrow')] + '.json'
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return None
+        
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('schema') != self._tel_cache_schema():
+                # Written by an older ingest layout; rebuild it
+                return None
+            
+            import pyarrow as pa
+            
+            # The file is uncompressed Arrow IPC, so the mapped bytes are the column
+            # buffers; null-free numeric columns become NumPy views of the mapping
+            # (same dtypes as a fresh ingest) and only bool/nullable columns are copied
+            table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            columns = {}
+            for name in table.column_names:
+                column = table.column(name)
+                chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+                columns[name] = chunk.to_numpy(zero_copy_only=False)
+            telemetry = pd.DataFrame(columns, copy=False)
+        except Exception:
+            return None
+        
+        lap = {
+            'LapTime': pd.Timedelta(seconds=meta['lap_time']),
+            'LapNumber': meta['lap_number'],
+            'Team': meta['team']
+        }
+        return telemetry, lap
+    
+    def _store_cached_lap(self, driver: str, telemetry: pd.DataFrame, lap):
+        """
+        Write a processed fastest lap to the telemetry cache, ignoring failures.
+        
+        Laps are stored as uncompressed Arrow IPC so they can be memory-mapped back;
+        without pyarrow installed the cache is simply not used.
+        """
+        if not _has_pyarrow():
+            return
+        
+        path = self._tel_cache_path(driver)
+        if path is None:
+            return
+        meta_path = path[:-len('.arrow')] + '.json'
+        try:
+            import pyarrow as pa
+            
+            os.makedirs(self._tel_cache_dir, exist_ok=True)
+            table = pa.Table.from_pandas(pd.DataFrame(telemetry), preserve_index=False)
+            with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            with open(meta_path, 'w') as f:
+                json.dump({
+                    'schema': self._tel_cache_schema(),
+                    'lap_time': lap['LapTime'].total_seconds(),
+                    'lap_number': float(lap['LapNumber']),
+                    'team': lap['Team']
+                }, f)
+        except Exception as e:
+            print(f"⚠️  Could not cache telemetry for {driver}: {e}")
+    
     def get_fastest_lap_telemetry(self, driver: str) -> Dict[str, Any]:
         """
         Get telemetry data for a driver's fastest lap.
         
+        Processed laps are cached as Arrow IPC in f1_tel_cache/, keyed by
+        year, race, session and driver, so repeat runs skip the FastF1 lap lookup.
+        
         Args:
             driver: Driver identifier (3-letter code like 'HAM', 'VER', etc.)
         
@@ -64,28 +321,63 @@ class F1TelemetryAnalyzer:
             dict: Dictionary containing lap data and telemetry
         """
         try:
-            # Get driver's laps
-            driver_laps = self.session.laps.pick_driver(driver)
-            
-            # Get fastest lap (excluding outliers)
-            fastest_lap = driver_laps.pick_fastest()
+            cached = self._load_cached_lap(driver)
+            if cached is not None:
+                telemetry, fastest_lap = cached
+            else:
+                # Get driver's laps
+                driver_laps = self._laps_by_driver.get(driver)
+                if driver_laps is None:
+                    raise ValueError(f"No laps found for driver {driver}")
+                
+                # Get fastest lap (excluding outliers)
+                fastest_lap = driver_laps.pick_fastest()
+                
+                if fastest_lap.empty:
+                    raise ValueError(f"No valid laps found for driver {driver}")
+                
+                # Get telemetry for the fastest lap
+                telemetry = fastest_lap.get_telemetry()
+                
+                # Keep only the columns something downstream reads, then downcast once
+                # so every later pass (concat, plots, saves) scans fewer, narrower columns
+                telemetry = telemetry[[c for c in self.INGEST_COLUMNS if c in telemetry.columns]]
+                telemetry = telemetry.astype(
+                    {c: t for c, t in self.INGEST_DTYPES.items() if c in telemetry.columns},
+                    copy=False
+                )
+                
+                # Acceleration, and a rough distance if FastF1 gave none, from one compiled
+                # pass over the raw speed array (imported here so importing this module skips Numba)
+                from _kernels import distance_and_accel
+                speed = telemetry['Speed'].to_numpy(dtype=np.float32, copy=False)
+                if 'Time' in telemetry.columns:
+                    # Samples are irregularly spaced, so use the real interval before each one
+                    dt = np.diff(telemetry['Time'].dt.total_seconds().to_numpy(np.float32), prepend=np.float32(0))
+                else:
+                    dt = np.full(len(speed), 0.1, dtype=np.float32)
+                distance, acceleration = distance_and_accel(speed, dt)
+                if 'Distance' not in telemetry.columns:
+                    telemetry['Distance'] = distance
+                if 'Time' not in telemetry.columns:
+                    # A nominal 0.1 s interval is good enough for rough distance, not acceleration
+                    acceleration[:] = np.nan
+                telemetry['Acceleration'] = acceleration
+                
+                self._store_cached_lap(driver, telemetry, fastest_lap)
             
-            if fastest_lap.empty:
-                raise ValueError(f"No valid laps found for driver {driver}")
-            
-            # Get telemetry for the fastest lap
-            telemetry = fastest_lap.get_telemetry()
-            
-            # Add distance column if not present
-            if 'Distance' not in telemetry.columns:
-                telemetry['Distance'] = np.cumsum(telemetry['Speed'] / 3.6 * 0.1)  # Rough distance calculation
+            channels = LapTelemetry.from_telemetry(telemetry, driver, fastest_lap)
             
+            # Summary reductions never change after ingest, so compute them once here
             driver_info = {
                 'driver': driver,
                 'lap_time': fastest_lap['LapTime'],
                 'lap_number': fastest_lap['LapNumber'],
                 'telemetry': telemetry,
-                'team': fastest_lap['Team']
+                'channels': channels,
+                'team': fastest_lap['Team'],
+                'max_speed': float(channels.speed.max()),
+                'avg_speed': float(channels.speed.mean())
             }
             
             print(f"✅ Fastest lap for {driver}: {fastest_lap['LapTime']} (Lap {fastest_lap['LapNumber']})")
@@ -129,20 +421,75 @@ class F1TelemetryAnalyzer:
         """
         Prepare combined telemetry data for easier comparison.
         """
-        tel1 = self.driver1_data['telemetry'].copy()
-        tel2 = self.driver2_data['telemetry'].copy()
-        
-        # Add driver identifier to each telemetry dataset
-        tel1['Driver'] = self.driver1_data['driver']
-        tel2['Driver'] = self.driver2_data['driver']
+        tel1 = self.driver1_data['telemetry']
+        tel2 = self.driver2_data['telemetry']
         
-        # Combine the datasets
+        # Combine the datasets; concat already allocates new columns, so the
+        # per-driver frames don't need copying first
         self.combined_data = pd.concat([tel1, tel2], ignore_index=True)
         
+        # Add the driver identifier as a categorical built straight from int8 codes,
+        # instead of broadcasting the driver strings into an object column
+        drivers = list(dict.fromkeys([self.driver1_data['driver'], self.driver2_data['driver']]))
+        codes = np.repeat(
+            np.array([0, drivers.index(self.driver2_data['driver'])], dtype=np.int8),
+            [len(tel1), len(tel2)]
+        )
+        self.combined_data['Driver'] = pd.Categorical.from_codes(codes, categories=drivers)
+        
+        self._resample_to_common_grid()
+        
         print(f"✅ Combined telemetry data prepared:")
         print(f"   {self.driver1_data['driver']}: {len(tel1)} data points")
         print(f"   {self.driver2_data['driver']}: {len(tel2)} data points")
     
+    def _resample_to_common_grid(self):
+        """
+        Interpolate both laps' speed and throttle onto one shared distance grid.
+        
+        The grid runs to the shorter of the two lap distances and is stored on
+        self.distance_grid; each driver_info gets aligned 'speed_r' and 'throttle_r'
+        arrays, so the speed gap is one subtraction of the two 'speed_r' arrays.
+        
+        Speed, throttle, brake and gear are also packed into 'blocks' (see BLOCK_SIZE)
+        so multi-channel kernels read one contiguous 4 x 64 tile per block.
+        """
+        lap1 = self.driver1_data['channels']
+        lap2 = self.driver2_data['channels']
+        
+        self.distance_grid = np.linspace(
+            0.0, min(lap1.distance[-1], lap2.distance[-1]), self.RESAMPLE_POINTS, dtype=np.float32
+        )
+        for driver_info, lap in [(self.driver1_data, lap1), (self.driver2_data, lap2)]:
+            driver_info['speed_r'] = np.interp(self.distance_grid, lap.distance, lap.speed).astype(np.float32)
+            driver_info['throttle_r'] = np.interp(self.distance_grid, lap.distance, lap.throttle).astype(np.float32)
+            brake_r = np.interp(self.distance_grid, lap.distance, lap.brake)
+            gear_r = np.rint(np.interp(self.distance_grid, lap.distance, lap.n_gear))
+            
+            channels = np.stack([driver_info['speed_r'], driver_info['throttle_r'], brake_r, gear_r]).astype(np.float32)
+            n_blocks = self.RESAMPLE_POINTS // self.BLOCK_SIZE
+            driver_info['blocks'] = channels.reshape(4, n_blocks, self.BLOCK_SIZE).transpose(1, 0, 2).copy()
+    
+    def find_first_gap(self, speed_gap: float = 10.0, throttle_gap: float = 20.0):
+        """
+        Find where on the lap the drivers first differ in both speed and throttle.
+        
+        Args:
+            speed_gap: Minimum absolute speed difference in km/h
+            throttle_gap: Minimum absolute throttle difference in %
+        
+        Returns:
+            float: Distance (m) of the first such point, or None if there is none
+        """
+        if self.distance_grid is None:
+            print("❌ No comparison data. Please run comparison first.")
+            return None
+        
+        from _kernels import first_joint_gap
+        idx = first_joint_gap(self.driver1_data['blocks'], self.driver2_data['blocks'],
+                              speed_gap, throttle_gap)
+        return float(self.distance_grid[idx]) if idx >= 0 else None
+    
     def get_comparison_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the comparison between the two drivers.
@@ -159,16 +506,16 @@ class F1TelemetryAnalyzer:
                 'team': self.driver1_data['team'],
                 'lap_time': self.driver1_data['lap_time'],
                 'lap_number': self.driver1_data['lap_number'],
-                'max_speed': self.driver1_data['telemetry']['Speed'].max(),
-                'avg_speed': self.driver1_data['telemetry']['Speed'].mean()
+                'max_speed': self.driver1_data['max_speed'],
+                'avg_speed': self.driver1_data['avg_speed']
             },
             'driver2': {
                 'name': self.driver2_data['driver'],
                 'team': self.driver2_data['team'],
                 'lap_time': self.driver2_data['lap_time'],
                 'lap_number': self.driver2_data['lap_number'],
-                'max_speed': self.driver2_data['telemetry']['Speed'].max(),
-                'avg_speed': self.driver2_data['telemetry']['Speed'].mean()
+                'max_speed': self.driver2_data['max_speed'],
+                'avg_speed': self.driver2_data['avg_speed']
             }
         }
         
@@ -179,18 +526,38 @@ class F1TelemetryAnalyzer:
         
         return summary
     
-    def save_data(self, filename: str = 'f1_telemetry_comparison.csv'):
+    def save_data(self, filename: str = 'f1_telemetry_comparison.parquet', fmt: str = 'parquet'):
         """
-        Save the combined telemetry data to a CSV file.
+        Save the combined telemetry data to a Parquet or CSV file.
+        
+        Parquet is columnar and Snappy-compressed, so it is much smaller and faster
+        to write and reload than CSV; the Driver column is stored dictionary-encoded.
+        
+        Parquet needs the optional pyarrow package; without it the data is saved
+        as CSV next to the requested name instead.
         
         Args:
             filename: Name of the output file
+            fmt: 'parquet' (requires pyarrow) or 'csv'
         """
-        if self.combined_data is not None:
+        if self.combined_data is None:
+            print("❌ No data to save. Please run comparison first.")
+            return
+        
+        if fmt == 'parquet' and not _has_parquet_engine():
+            filename = os.path.splitext(filename)[0] + '.csv'
+            fmt = 'csv'
+            print("⚠️  pyarrow is not installed, saving as CSV instead (pip install pyarrow for Parquet)")
+        
+        if fmt == 'parquet':
+            self.combined_data.to_parquet(filename, index=False, compression='snappy')
+        elif fmt == 'csv':
             self.combined_data.to_csv(filename, index=False)
-            print(f"✅ Data saved to {filename}")
         else:
-            print("❌ No data to save. Please run comparison first.")
+            print(f"❌ Unknown data format: {fmt}. Use 'parquet' or 'csv'.")
+            return
+        
+        print(f"✅ Data saved to {filename}")
     
     def plot_speed_comparison(self, save_plot: bool = True):
         """
@@ -203,15 +570,16 @@ class F1TelemetryAnalyzer:
             print("❌ No data to plot. Please run comparison first.")
             return
         
+        plt = self._pyplot()
         plt.figure(figsize=(12, 8))
         
         # Plot speed vs distance for both drivers
-        tel1 = self.driver1_data['telemetry']
-        tel2 = self.driver2_data['telemetry']
+        lap1 = self.driver1_data['channels']
+        lap2 = self.driver2_data['channels']
         
         plt.subplot(2, 1, 1)
-        plt.plot(tel1['Distance'], tel1['Speed'], label=f"{self.driver1_data['driver']} ({self.driver1_data['team']})", linewidth=2)
-        plt.plot(tel2['Distance'], tel2['Speed'], label=f"{self.driver2_data['driver']} ({self.driver2_data['team']})", linewidth=2)
+        plt.plot(lap1.distance, lap1.speed, label=f"{lap1.driver} ({lap1.team})", linewidth=2)
+        plt.plot(lap2.distance, lap2.speed, label=f"{lap2.driver} ({lap2.team})", linewidth=2)
         plt.xlabel('Distance (m)')
         plt.ylabel('Speed (km/h)')
         plt.title('Speed Comparison - Fastest Laps')
@@ -220,8 +588,8 @@ class F1TelemetryAnalyzer:
         
         # Plot throttle comparison
         plt.subplot(2, 1, 2)
-        plt.plot(tel1['Distance'], tel1['Throttle'], label=f"{self.driver1_data['driver']} Throttle", linewidth=2)
-        plt.plot(tel2['Distance'], tel2['Throttle'], label=f"{self.driver2_data['driver']} Throttle", linewidth=2)
+        plt.plot(lap1.distance, lap1.throttle, label=f"{lap1.driver} Throttle", linewidth=2)
+        plt.plot(lap2.distance, lap2.throttle, label=f"{lap2.driver} Throttle", linewidth=2)
         plt.xlabel('Distance (m)')
         plt.ylabel('Throttle (%)')
         plt.title('Throttle Comparison - Fastest Laps')
@@ -231,36 +599,67 @@ class F1TelemetryAnalyzer:
         plt.tight_layout()
         
         if save_plot:
-            plt.savefig('f1_speed_comparison.png', dpi=300, bbox_inches='tight')
-            print("✅ Plot saved as f1_speed_comparison.png")
+            filename = 'f1_speed_comparison.png'
+            fig = plt.gcf()
+            if plt.get_backend().lower() in _NON_INTERACTIVE_BACKENDS:
+                # Nothing else draws this figure, so rasterize at 300 dpi in the background;
+                # wait_for_saves() reports the result
+                future = _IO_POOL.submit(fig.savefig, filename, dpi=300, bbox_inches='tight')
+                self._pending_saves.append((filename, future))
+            else:
+                # Matplotlib is not thread-safe and show() is about to draw this figure
+                fig.savefig(filename, dpi=300, bbox_inches='tight')
+                print(f"✅ Plot saved as {filename}")
         
         plt.show()
+    
+    def wait_for_saves(self) -> bool:
+        """
+        Wait for background plot saves to finish and report each one.
+        
+        Returns:
+            bool: True if every pending save succeeded
+        """
+        success = True
+        for filename, future in self._pending_saves:
+            try:
+                future.result()
+                print(f"✅ Plot saved as {filename}")
+            except Exception as e:
+                print(f"❌ Error saving {filename}: {e}")
+                success = False
+        self._pending_saves = []
+        return success
 
-    def plot_advanced_visuals(self):
+    def plot_advanced_visuals(self, show: bool = True, save_dir: str = None):
         """
         Create advanced visualizations using Plotly.
+        
+        Args:
+            show: Whether to open each figure in the browser
+            save_dir: Directory to write the figures to as HTML, or None to skip saving
         """
-        import plotly.express as px
-        import plotly.graph_objects as go
-
         if not self.driver1_data or not self.driver2_data:
             print("❌ No data to plot. Please run comparison first.")
             return
 
+        px, go = self._plotly_modules()
+
         # Speed vs Distance Plot
         fig1 = px.line(self.combined_data, x='Distance', y='Speed', color='Driver',
                       title='Speed vs Distance',
                       labels={'Speed': 'Speed (km/h)', 'Distance': 'Distance (m)'}
                       )
-        fig1.show()
+        figures = [('speed_vs_distance', fig1)]
 
-        # Gear Heatmap over Track
+        # Gear Heatmap over Track, fed straight from the per-channel arrays built at ingest
         fig2 = go.Figure()
         for driver in [self.driver1_data, self.driver2_data]:
+            lap = driver['channels']
             heatmap = go.Heatmap(
-                z=driver['telemetry']['nGear'],
-                x=driver['telemetry']['X'],
-                y=driver['telemetry']['Y'],
+                z=lap.n_gear,
+                x=lap.x,
+                y=lap.y,
                 colorscale='Viridis',
                 colorbar=dict(title='Gear')
             )
@@ -269,8 +668,17 @@ class F1TelemetryAnalyzer:
         fig2.update_layout(title='Gear Heatmap Over Track',
                            xaxis_title='X',
                            yaxis_title='Y')
+        figures.append(('gear_heatmap_over_track', fig2))
 
-        fig2.show()
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+        for name, fig in figures:
+            if show:
+                fig.show()
+            if save_dir:
+                # Reference plotly.js from the CDN instead of inlining ~3.5 MB per file
+                fig.write_html(os.path.join(save_dir, f"{name}.html"), include_plotlyjs='cdn')
+                print(f"✅ Saved {name}.html to {save_dir}")
 
 
 def main():
@@ -289,11 +697,13 @@ def main():
     driver1 = "VER"  # Max Verstappen
     driver2 = "LEC"  # Charles Leclerc
     
-    print(f"\nConfiguration:")
-    print(f"Year: {year}")
-    print(f"Race: {race}")
-    print(f"Session: {session_type}")
-    print(f"Drivers: {driver1} vs {driver2}")
+    sys.stdout.write("\n".join([
+        f"\nConfiguration:",
+        f"Year: {year}",
+        f"Race: {race}",
+        f"Session: {session_type}",
+        f"Drivers: {driver1} vs {driver2}"
+    ]) + "\n")
     
     # Load session
     if not analyzer.load_session(year, race, session_type):
@@ -303,26 +713,31 @@ def main():
     if analyzer.compare_drivers(driver1, driver2):
         # Get and display summary
         summary = analyzer.get_comparison_summary()
-        print("\n" + "=" * 50)
-        print("COMPARISON SUMMARY")
-        print("=" * 50)
-        print(f"{summary['driver1']['name']} ({summary['driver1']['team']})")
-        print(f"  Lap Time: {summary['driver1']['lap_time']}")
-        print(f"  Max Speed: {summary['driver1']['max_speed']:.1f} km/h")
-        print(f"  Avg Speed: {summary['driver1']['avg_speed']:.1f} km/h")
-        print()
-        print(f"{summary['driver2']['name']} ({summary['driver2']['team']})")
-        print(f"  Lap Time: {summary['driver2']['lap_time']}")
-        print(f"  Max Speed: {summary['driver2']['max_speed']:.1f} km/h")
-        print(f"  Avg Speed: {summary['driver2']['avg_speed']:.1f} km/h")
-        print()
-        print(f"Faster Driver: {summary['faster_driver']}")
-        print(f"Time Difference: {abs(summary['time_difference_seconds']):.3f} seconds")
+        d1, d2 = summary['driver1'], summary['driver2']
+        # Build the whole summary first and write it in one call
+        sys.stdout.write("\n".join([
+            "\n" + "=" * 50,
+            "COMPARISON SUMMARY",
+            "=" * 50,
+            f"{d1['name']} ({d1['team']})",
+            f"  Lap Time: {d1['lap_time']}",
+            f"  Max Speed: {d1['max_speed']:.1f} km/h",
+            f"  Avg Speed: {d1['avg_speed']:.1f} km/h",
+            "",
+            f"{d2['name']} ({d2['team']})",
+            f"  Lap Time: {d2['lap_time']}",
+            f"  Max Speed: {d2['max_speed']:.1f} km/h",
+            f"  Avg Speed: {d2['avg_speed']:.1f} km/h",
+            "",
+            f"Faster Driver: {summary['faster_driver']}",
+            f"Time Difference: {abs(summary['time_difference_seconds']):.3f} seconds"
+        ]) + "\n")
         
         # Save data and create plots
         analyzer.save_data()
         analyzer.plot_speed_comparison()
         analyzer.plot_advanced_visuals()
+        analyzer.wait_for_saves()
         
         print("\n✅ Analysis complete! Check the generated files for detailed data and visualizations.")
 
@@ -5,6 +5,10 @@ Quick F1 Analysis Examples
 Run this file to see some pre-configured interesting comparisons.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
+import fastf1
+
 from f1_telemetry_analysis import F1TelemetryAnalyzer
 
 def example_championship_battle():
@@ -20,7 +24,7 @@ def example_championship_battle():
             summary = analyzer.get_comparison_summary()
             print(f"\n🏆 Faster: {summary['faster_driver']}")
             print(f"⏱️  Gap: {abs(summary['time_difference_seconds']):.3f}s")
-            analyzer.save_data("monza_ver_vs_nor.csv")
+            analyzer.save_data("monza_ver_vs_nor.csv", fmt='csv')
 
 def example_teammates():
     """Compare teammates at a technical circuit."""
@@ -35,7 +39,7 @@ def example_teammates():
             summary = analyzer.get_comparison_summary()
             print(f"\n🏆 Faster: {summary['faster_driver']}")
             print(f"⏱️  Gap: {abs(summary['time_difference_seconds']):.3f}s")
-            analyzer.save_data("hungary_ham_vs_rus.csv")
+            analyzer.save_data("hungary_ham_vs_rus.csv", fmt='csv')
 
 def example_different_teams():
     """Compare drivers from different teams at Monaco."""
@@ -50,18 +54,33 @@ def example_different_teams():
             summary = analyzer.get_comparison_summary()
             print(f"\n🏆 Faster: {summary['faster_driver']}")
             print(f"⏱️  Gap: {abs(summary['time_difference_seconds']):.3f}s")
-            analyzer.save_data("monaco_lec_vs_pia.csv")
+            analyzer.save_data("monaco_lec_vs_pia.csv", fmt='csv')
 
 def run_all_examples():
-    """Run all example comparisons."""
+    """
+    Run all example comparisons.
+    
+    The examples are independent and each is dominated by a CPU-heavy FastF1
+    session load, so they run in separate processes; output may interleave.
+    
+    The processes share FastF1's cache: its SQLite HTTP cache serializes concurrent
+    writers, and each session's parsed data lives in its own files. The one entry
+    all three need, the 2024 event schedule, is fetched up front so the workers
+    don't race to download and write it.
+    """
     print("F1 Telemetry Analysis - Quick Examples")
     print("=====================================")
     print("\nThis will run several interesting driver comparisons...")
     
     try:
-        example_championship_battle()
-        example_teammates() 
-        example_different_teams()
+        F1TelemetryAnalyzer()  # enables the FastF1 cache in this process
+        fastf1.get_event_schedule(2024)
+        
+        examples = [example_championship_battle, example_teammates, example_different_teams]
+        with ProcessPoolExecutor(max_workers=len(examples)) as ex:
+            futures = [ex.submit(example) for example in examples]
+            for future in futures:
+                future.result()
         
         print("\n" + "=" * 60)
         print("✅ All examples completed!")
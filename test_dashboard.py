@@ -24,8 +24,7 @@ def test_fastf1_basic():
         # Test cache setup
         import os
         cache_dir = 'f1_cache'
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
         fastf1.Cache.enable_cache(cache_dir)
         print("✅ FastF1 cache setup successful")
         return True
@@ -98,6 +97,7 @@ def main():
         print("⚠️ Some tests failed. Check the errors above.")
         print("\nTry installing missing packages:")
         print("pip install dash plotly fastf1 pandas numpy")
+        print("Optional: pip install pyarrow (Parquet output and lap cache)")
 
 if __name__ == '__main__':
     main()